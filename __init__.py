@@ -1,6 +1,10 @@
 """
 This module provides a controller for the Sunpower Cryocooler.
 """
-from .sunpower_cryocooler import SunpowerCryocooler
+from .sunpower_cryocooler import (
+    AsyncSunpowerCryocooler,
+    SunpowerCryocooler,
+    SunpowerCryocoolerPool,
+)
 
-__all__ = ["SunpowerCryocooler"]
+__all__ = ["AsyncSunpowerCryocooler", "SunpowerCryocooler", "SunpowerCryocoolerPool"]
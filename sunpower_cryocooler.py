@@ -1,79 +1,298 @@
 """
 A Python class to control a Sunpower cryocooler via serial or TCP connection.
 """
+import asyncio
+import logging
+import re
+import selectors
 import socket
 import time
-from typing import Union
+import weakref
+from typing import List, Optional, Tuple, Union
 import serial
 
 from hardware_device_base import HardwareSensorBase
 
+# Number of non-blank lines (command echo plus value lines) in a complete reply
+# to each command, keyed by the part before any "=" so that set commands such
+# as "TTARGET=80" are framed too.  Replies to STATUS and to unlisted commands
+# are considered complete once the device has been quiet for ``reply_gap``
+# seconds.
+_REPLY_LINES = {
+    "TC": 2,
+    "TEMP RJ": 2,
+    "TTARGET": 2,
+    "P": 2,
+    "PWOUT": 2,
+    "E": 4,
+    "ERROR": 2,
+    "VERSION": 2,
+    "COOLER": 2,
+}
+
+# Atomic items mapped to the query command and the reply line holding the value.
+_ATOMIC_QUERIES = {
+    "cold_head_temp": ("TC", 1),
+    "reject_temp": ("TEMP RJ", 1),
+    "target_temp": ("TTARGET", 1),
+    "measured_power": ("P", 1),
+    "commanded_power": ("PWOUT", 1),
+    "current_commanded_power": ("E", 3),
+}
+
+# Pre-encoded payloads for the fixed command set
+_CMD_BYTES = {
+    name: (name + "\r").encode("ascii")
+    for name in ("TC", "TEMP RJ", "TTARGET", "P", "PWOUT", "E", "STATUS",
+                 "ERROR", "VERSION", "COOLER=ON", "COOLER=OFF")
+}
+
+_TRUE_STRINGS = frozenset(("true", "yes", "on", "1"))
+_FALSE_STRINGS = frozenset(("false", "no", "off", "0"))
+_INT_RE = re.compile(r"^[+-]?\d+$")
+_FLOAT_RE = re.compile(r"^[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?$")
+# Handlers that HardwareSensorBase attached for an instance of this module
+_INSTALLED_HANDLERS = weakref.WeakSet()
+# Control bytes removed from replies; tab, CR and LF are kept since either
+# CR or LF may terminate a line
+_CONTROL_BYTES = bytes(b for b in (*range(0x20), 0x7f) if b not in b"\t\n\r")
+
+
+def _count_lines(buf: bytes) -> int:
+    """Count the complete, non-blank lines held in a receive buffer."""
+    lines = bytes(buf).translate(None, _CONTROL_BYTES).splitlines()
+    if lines and not buf.endswith((b"\r", b"\n")):
+        lines.pop()
+    return sum(1 for line in lines if line.strip())
+
+
+def _reply_lines(command: str) -> int:
+    """Return the number of lines in a complete reply to command, or 0 if unknown."""
+    return _REPLY_LINES.get(command.partition("=")[0], 0)
+
+
+def _from_echo(lines: list, command: str) -> list:
+    """Drop any lines that arrived ahead of the echo of command."""
+    try:
+        return lines[lines.index(command):]
+    except ValueError:
+        return lines
+
+
+def _take_complete(carry: bytearray) -> bytes:
+    """Remove and return the complete lines held in a receive buffer."""
+    end = max(carry.rfind(b"\r"), carry.rfind(b"\n")) + 1
+    raw_data = bytes(carry[:end])
+    del carry[:end]
+    return raw_data
+
+
+def _tune_socket(sock: socket.socket):
+    """Disable Nagle and enable keepalive so dead links are noticed quickly."""
+    # Commands are a few bytes each; don't let Nagle hold them back
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # Probe after 5 s idle, every 2 s, give up after 3 misses.  Not every
+    # platform defines these options or accepts them on every socket.
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 5)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 2)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+    except (AttributeError, OSError):
+        pass
+
+
+def _encode_command(command: str) -> bytes:
+    """Return the wire bytes for a command, using the cache when possible."""
+    payload = _CMD_BYTES.get(command)
+    if payload is None:
+        payload = f"{command}\r".encode("ascii")
+    return payload
+
+
+def _debug_enabled(logger: Optional[logging.Logger]) -> bool:
+    """Return True if debug messages would be emitted by logger."""
+    return logger is not None and logger.isEnabledFor(logging.DEBUG)
+
+
+def _keep_existing_handlers(logger: Optional[logging.Logger], existing: list):
+    """Drop handlers added to a logger that still holds an earlier instance's.
+
+    HardwareSensorBase attaches handlers on every construction, so instances
+    sharing a logfile would otherwise emit each record once per instance.
+    Handlers attached by anything else are left alone, and if the application
+    has since removed ours (e.g. with dictConfig) the new ones are kept.
+    """
+    if logger is None:
+        return
+    added = [handler for handler in logger.handlers if handler not in existing]
+    if not added:
+        return
+    if not any(handler in _INSTALLED_HANDLERS for handler in existing):
+        _INSTALLED_HANDLERS.update(added)
+        return
+    for handler in added:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def _decode_lines(raw_data: bytes) -> list:
+    """Split a raw reply into stripped, non-blank lines."""
+    # Remove stray control bytes in one C-level pass, then drop blank lines
+    # before decoding; the protocol is ASCII-only
+    cleaned = raw_data.translate(None, _CONTROL_BYTES)
+    return [line.decode("ascii", "replace")
+            for line in map(bytes.strip, cleaned.splitlines()) if line]
+
+
+def _split_replies(lines: list, commands: list) -> dict:
+    """Split the lines of several back-to-back replies on their command echoes."""
+    replies = {}
+    current = None
+    remaining = list(commands)
+    for line in lines:
+        if remaining and line == remaining[0]:
+            current = replies[remaining.pop(0)] = [line]
+        elif current is not None:
+            current.append(line)
+    return replies
+
 
 def parse_single_value(reply: list) -> Union[float, int, bool, str]:
     """Attempt to parse a single value from the reply list."""
+    return parse_indexed_value(reply, 1)
+
+
+def parse_float_value(reply: list, idx: int = 1) -> Union[float, int, bool, str]:
+    """Parse a reply value that is expected to be a number.
+
+    Tries float first and falls back to parse_indexed_value otherwise.
+    """
+    try:
+        return float(reply[idx])
+    except (IndexError, ValueError):
+        return parse_indexed_value(reply, idx)
+
+
+def parse_indexed_value(reply: list, idx: int = 1) -> Union[float, int, bool, str]:
+    """Attempt to parse the value on line idx of the reply list."""
     if not isinstance(reply, list):
         raise TypeError("reply must be a list")
 
-    try:
-        val = reply[1]
-    except IndexError:
+    if len(reply) <= idx:
         return "No reply"
+    val = reply[idx].strip()
 
     # Parse Booleans
-    if val.lower() in ("true", "yes", "on", "1"):
+    lowered = val.lower()
+    if lowered in _TRUE_STRINGS:
         return True
-    if val.lower() in ("false", "no", "off", "0"):
+    if lowered in _FALSE_STRINGS:
         return False
 
-    # Parse integers
-    try:
+    # Parse integers and floats
+    if _INT_RE.match(val):
         return int(val)
-    except ValueError:
-        pass
-
-    # Parse floats
-    try:
+    if _FLOAT_RE.match(val):
         return float(val)
-    except ValueError:
-        pass
 
     # Fallback: return string
-    return val.strip()
+    return val
 
 class SunpowerCryocooler(HardwareSensorBase):
     """A class to control a Sunpower cryocooler via serial or TCP connection."""
     # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-arguments
+    # Only this class's own attributes; those set by HardwareSensorBase still
+    # live in the instance __dict__ since the base does not define __slots__.
+    __slots__ = ("con_type", "read_timeout", "reply_gap", "connect_timeout", "socket_options",
+                 "ser", "sock", "_atomic_dispatch", "_rx_buf", "_rx_view", "_carry",
+                 "_write", "_write_many", "_read_raw", "_rx_selector", "_pooled")
+
+    # Connected TCP controllers, for poll_all(); weak so a dropped instance
+    # can still be garbage collected
+    _tcp_devices = weakref.WeakSet()
+
     def __init__(self, log: bool = True, logfile: str = __name__.rsplit(".", 1)[-1],
-                 read_timeout: float = 1.0):
-        """ Initialize the SunpowerCryocooler."""
+                 read_timeout: float = 1.0, *, reply_gap: float = 0.02,
+                 connect_timeout: float = 0.5,
+                 socket_options: Optional[List[Tuple[int, int, int]]] = None):
+        """ Initialize the SunpowerCryocooler.
 
+        socket_options is an optional list of (level, optname, value) tuples
+        applied to the TCP socket after connecting, e.g. to set TCP_QUICKACK.
+        """
+
+        existing_handlers = list(logging.getLogger(logfile).handlers)
         super().__init__(log, logfile)
+        _keep_existing_handlers(self.logger, existing_handlers)
         self.con_type = None
         self.read_timeout = read_timeout
+        self.reply_gap = reply_gap
+        self.connect_timeout = connect_timeout
+        self.socket_options = list(socket_options or [])
         self.ser = None
         self.sock = None
+        self._atomic_dispatch = {
+            "cold_head_temp": self.get_cold_head_temp,
+            "reject_temp": self.get_reject_temp,
+            "target_temp": self.get_target_temp,
+            "measured_power": self.get_measured_power,
+            "commanded_power": self.get_commanded_power,
+            "current_commanded_power": self.get_current_commanded_power,
+        }
+        # Reused receive buffer; _carry holds bytes not yet returned as lines
+        self._rx_buf = bytearray(4096)
+        self._rx_view = memoryview(self._rx_buf)
+        self._carry = bytearray()
+        # Transport-specific I/O callables, bound by _bind_io() on connect
+        self._write = None
+        self._write_many = None
+        self._read_raw = None
+        self._rx_selector = None
+        # Set by SunpowerCryocoolerPool; pooled connections outlive a with block
+        self._pooled = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the connection, unless it is pooled and no error occurred."""
+        if self.is_connected() and (exc_type is not None or not self._pooled):
+            self.disconnect()
 
     def connect(self, host, port, con_type: str ="tcp"):  # pylint: disable=W0221
         """Connect to the Sunpower controller."""
         if self.validate_connection_params((host, port)):
             try:
+                # Reconnecting: release the previous port or socket first
+                self._close_transport()
+                self._set_connected(False)
                 if con_type == "serial":
                     self.ser = serial.Serial(
                         port=host,
                         baudrate=port,
                         timeout=self.read_timeout,
+                        inter_byte_timeout=self.reply_gap,
                         parity=serial.PARITY_NONE,
                         stopbits=serial.STOPBITS_ONE,
                     )
                     self.report_info(f"Serial connection opened: {self.ser.is_open}")
-                    self._set_connected(True)
                     self.con_type = con_type
+                    self._bind_io()
+                    self._set_connected(True)
                 elif con_type == "tcp":
-                    self.sock = socket.create_connection((host, port), timeout=2)
+                    self.sock = socket.create_connection(
+                        (host, port), timeout=self.connect_timeout)
+                    _tune_socket(self.sock)
+                    for level, optname, value in self.socket_options:
+                        self.sock.setsockopt(level, optname, value)
                     self.sock.settimeout(self.read_timeout)
                     self.report_info(f"TCP connection opened: {host}:{port}")
-                    self._set_connected(True)
                     self.con_type = con_type
+                    self._bind_io()
+                    self._tcp_devices.add(self)
+                    self._set_connected(True)
                 else:
                     self._set_connected(False)
                     self.report_error("connection_type must be 'serial' or 'tcp'")
@@ -85,70 +304,190 @@ class SunpowerCryocooler(HardwareSensorBase):
             self.report_error(f"Invalid connection parameters: {host}:{port}")
             self._set_connected(False)
 
+    def _bind_io(self):
+        """Bind the I/O callables for con_type so the hot path never branches."""
+        if self.con_type == "serial":
+            self._write = self.ser.write
+            self._write_many = self._write_joined
+            self._read_raw = self._read_raw_serial
+        else:
+            self._write = self.sock.sendall
+            self._write_many = (self._write_gathered if hasattr(self.sock, "sendmsg")
+                                else self._write_joined)
+            self._read_raw = self._read_raw_tcp
+            # epoll/kqueue where available, so unlike select.select no fd limit
+            self._rx_selector = selectors.DefaultSelector()
+            self._rx_selector.register(self.sock, selectors.EVENT_READ)
+
     def disconnect(self):
         """Close the connection."""
         if not self.is_connected():
             self.report_warning("Already disconnected from device.")
             return
         try:
+            self._close_transport()
             if self.con_type == "serial":
-                self.ser.close()
                 self.report_info("Serial connection closed.")
             elif self.con_type == "tcp":
-                self.sock.close()
                 self.report_info("TCP connection closed.")
             self._set_connected(False)
         except Exception as ex:
             raise IOError(f"Failed to close connection: {ex}") from ex
 
+    def _close_transport(self):
+        """Close and forget the serial port or socket, if one is open."""
+        self._tcp_devices.discard(self)
+        self._carry.clear()
+        if self.ser is not None:
+            ser, self.ser = self.ser, None
+            ser.close()
+        if self.sock is not None:
+            sock, self.sock = self.sock, None
+            if self._rx_selector is not None:
+                self._rx_selector.close()
+                self._rx_selector = None
+            sock.close()
+
     def _send_command(self, command: str) -> bool:  # pylint: disable=W0221
         """Send a command to the Sunpower controller."""
         if not self.is_connected():
             self.report_error("Device is not connected.")
             return False
 
-        full_cmd = f"{command}\r"
         try:
-            self.report_debug(f"Sending command: {full_cmd}")
-            if self.con_type == "serial":
-                self.ser.write(full_cmd.encode())
-            elif self.con_type == "tcp":
-                self.sock.sendall(full_cmd.encode())
+            payload = _encode_command(command)
+            self._discard_stale()
+            if _debug_enabled(self.logger):
+                self.report_debug(f"Sending command: {payload!r}")
+            self._write(payload)
         except Exception as ex:
             self.report_error(f"Failed to send command: {ex}")
             raise IOError(f"Failed to send command: {ex}") from ex
         self.report_debug("Command sent")
         return True
 
-    def _read_reply(self) -> list:
+    def _send_commands(self, commands: list) -> bool:
+        """Send several commands in one write so they can share a TCP segment."""
+        if not self.is_connected():
+            self.report_error("Device is not connected.")
+            return False
+
+        try:
+            payloads = [_encode_command(cmd) for cmd in commands]
+            self._discard_stale()
+            if _debug_enabled(self.logger):
+                self.report_debug(f"Sending commands: {payloads!r}")
+            self._write_many(payloads)
+        except Exception as ex:
+            self.report_error(f"Failed to send commands: {ex}")
+            raise IOError(f"Failed to send commands: {ex}") from ex
+        self.report_debug("Commands sent")
+        return True
+
+    def _discard_stale(self):
+        """Throw away anything received since the last read finished.
+
+        The device only speaks when spoken to, so this is the remainder of a
+        reply that arrived after its read gave up; left in place it would be
+        taken as the reply to the next command.
+        """
+        if self.con_type == "serial":
+            self.ser.reset_input_buffer()
+        elif self._rx_selector.select(0):
+            self._fill_tcp()
+        if self._carry:
+            if _debug_enabled(self.logger):
+                self.report_debug(f"Discarding stale data: {bytes(self._carry)!r}")
+            self._carry.clear()
+
+    def _write_gathered(self, payloads: list):
+        """Write payloads with one sendmsg gather call, then any remainder."""
+        sent = self.sock.sendmsg(payloads)
+        if sent < sum(map(len, payloads)):
+            self.sock.sendall(b"".join(payloads)[sent:])
+
+    def _write_joined(self, payloads: list):
+        """Write payloads as one joined buffer where gather writes aren't available."""
+        self._write(b"".join(payloads))
+
+    def _fill_tcp(self) -> int:
+        """Drain whatever the device has already sent into _carry.
+
+        Returns the number of bytes added; zero once the peer has closed.
+        """
+        added = 0
+        # The socket has a timeout, so MSG_DONTWAIT would wait it out
+        # instead of raising; poll with a zero timeout between reads.
+        while True:
+            nbytes = self.sock.recv_into(self._rx_buf)
+            self._carry += self._rx_view[:nbytes]
+            added += nbytes
+            if not nbytes or not self._rx_selector.select(0):
+                break
+        return added
+
+    def _read_raw_tcp(self, expected_lines: int = 0) -> bytes:
+        """Read raw bytes until the reply is complete or read_timeout expires.
+
+        With expected_lines the reply is complete as soon as that many lines
+        have arrived, otherwise once the device has sent a line terminator and
+        stayed quiet for reply_gap seconds.  Only complete lines are returned;
+        an unterminated tail stays in _carry for the next read.
+        """
+        carry = self._carry
+        deadline = time.monotonic() + self.read_timeout
+        timeout = self.read_timeout
+        while timeout > 0 and self._rx_selector.select(timeout):
+            if not self._fill_tcp():
+                break
+            if expected_lines and _count_lines(carry) >= expected_lines:
+                break
+            timeout = deadline - time.monotonic()
+            if not expected_lines and carry.endswith((b"\r", b"\n")):
+                timeout = min(timeout, self.reply_gap)
+        return _take_complete(carry)
+
+    def _read_raw_serial(self, expected_lines: int = 0) -> bytes:
+        """Read raw bytes from the serial port with the framing of _read_raw_tcp.
+
+        pyserial does the waiting: read() gives up after read_timeout without
+        data and otherwise returns once the line has been quiet for
+        inter_byte_timeout (reply_gap).
+        """
+        carry = self._carry
+        deadline = time.monotonic() + self.read_timeout
+        while True:
+            chunk = self.ser.read(len(self._rx_buf))
+            if not chunk:
+                break
+            carry += chunk
+            if expected_lines:
+                if _count_lines(carry) >= expected_lines:
+                    break
+            elif carry.endswith((b"\r", b"\n")):
+                break
+            if time.monotonic() >= deadline:
+                break
+        return _take_complete(carry)
+
+    def _read_reply(self, expected_lines: int = 0) -> list:
         """Read and return lines from the device."""
         if not self.is_connected():
             self.report_error("Device is not connected.")
             return []
 
-        lines_out = []
         try:
-            raw_data = None
-            if self.con_type == "serial":
-                raw_data = self.ser.read(1024)
-            elif self.con_type == "tcp":
-                try:
-                    raw_data = self.sock.recv(1024)
-                except socket.timeout:
-                    self.report_warning("TCP read timeout.", errno=-1)
-                    return []
-
+            raw_data = self._read_raw(expected_lines)
             if not raw_data:
-                self.report_warning("No data received.", errno=-1)
+                if self.con_type == "tcp":
+                    self.report_warning("TCP read timeout.", errno=-1)
+                else:
+                    self.report_warning("No data received.", errno=-1)
                 return []
 
-            self.report_debug(f"Raw received: {repr(raw_data)}")
-            lines = raw_data.decode(errors="replace").splitlines()
-            for line in lines:
-                stripped = line.strip()
-                if stripped:
-                    lines_out.append(stripped)
-            return lines_out
+            if _debug_enabled(self.logger):
+                self.report_debug(f"Raw received: {raw_data!r}")
+            return _decode_lines(raw_data)
         except (serial.SerialException, socket.error, ValueError) as ex:
             self.report_error(f"Failed to read reply: {ex}")
             return []
@@ -157,30 +496,103 @@ class SunpowerCryocooler(HardwareSensorBase):
         """Send a command and read the reply."""
         if self.is_connected():
             self._send_command(command)
-            time.sleep(0.2)  # wait a bit for device to reply
-            return self._read_reply()
+            return _from_echo(self._read_reply(_reply_lines(command)), command)
         self.report_error(f"Failed to send command '{command}': Not connected")
         return []
 
+    @classmethod
+    def poll_all(cls, command: str, timeout: float = 1.0) -> dict:
+        """Send a command to every connected TCP controller and gather the replies.
+
+        The replies are gathered from one thread by a single selector, so many
+        controllers are polled in about one round trip.  Replies to commands
+        without a known line count are collected until timeout.
+        Returns a dict of controller to reply lines; controllers that failed map
+        to [] and those whose connection dropped are disconnected.
+        """
+        # pylint: disable=protected-access
+        devices = [dev for dev in set(cls._tcp_devices) if dev.is_connected()]
+        expected = _reply_lines(command)
+        replies = {}
+        dropped = []
+        # Only wait on controllers still owing a reply, so finished or closed
+        # sockets can't keep select() returning immediately
+        with selectors.DefaultSelector() as pending:
+            for dev in devices:
+                try:
+                    dev._send_command(command)
+                except IOError:
+                    replies[dev] = []
+                    dropped.append(dev)
+                else:
+                    pending.register(dev.sock, selectors.EVENT_READ, dev)
+
+            deadline = time.monotonic() + timeout
+            while pending.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in pending.select(remaining):
+                    dev = key.data
+                    try:
+                        closed = not dev._fill_tcp()
+                    except OSError as ex:
+                        dev.report_error(f"Failed to read reply: {ex}")
+                        replies[dev] = []
+                        closed = True
+                    if closed or (expected and _count_lines(dev._carry) >= expected):
+                        pending.unregister(dev.sock)
+                        if closed:
+                            dropped.append(dev)
+
+        for dev in devices:
+            if dev not in replies:
+                replies[dev] = _from_echo(_decode_lines(_take_complete(dev._carry)), command)
+        for dev in dropped:
+            dev._drop_connection()
+        return replies
+
+    def _drop_connection(self):
+        """Disconnect after the peer has gone away, even if closing fails."""
+        try:
+            self.disconnect()
+        except IOError:
+            self._set_connected(False)
+
     # --- User-Facing Methods (synchronous) ---
     def get_atomic_value(self, item: str ="") -> Union[float, int, str, None]:
         """Get the atomic value from the Sunpower cryocooler."""
-        retval = None
-        if item == "cold_head_temp":
-            retval = self.get_cold_head_temp()
-        elif item == "reject_temp":
-            retval = self.get_reject_temp()
-        elif item == "target_temp":
-            retval = self.get_target_temp()
-        elif item == "measured_power":
-            retval = self.get_measured_power()
-        elif item == "commanded_power":
-            retval = self.get_commanded_power()
-        elif item == "current_commanded_power":
-            retval = self.get_current_commanded_power()
-        else:
+        getter = self._atomic_dispatch.get(item)
+        if getter is None:
             self.report_error(f"Unknown item: {item}")
-        return retval
+            return None
+        return getter()
+
+    def get_all_values(self, items: list) -> dict:
+        """Get several atomic values with a single round trip.
+
+        All queries are sent back-to-back and the combined reply is read once.
+        Returns a dict of item to value; unknown items are reported and skipped.
+        """
+        queries = {}
+        for item in items:
+            if item in _ATOMIC_QUERIES:
+                queries[item] = _ATOMIC_QUERIES[item]
+            else:
+                self.report_error(f"Unknown item: {item}")
+        if not queries:
+            return {}
+        if not self.is_connected():
+            self.report_error("Failed to get values: Not connected")
+            return {item: "No reply" for item in queries}
+
+        commands = list(dict.fromkeys(cmd for cmd, _ in queries.values()))
+        self._send_commands(commands)
+        lines = self._read_reply(sum(_REPLY_LINES[cmd] for cmd in commands))
+        replies = _split_replies(lines, commands)
+
+        return {item: parse_float_value(replies.get(cmd, []), idx)
+                for item, (cmd, idx) in queries.items()}
 
     def get_status(self):
         """Get the status of the Sunpower cryocooler."""
@@ -196,15 +608,15 @@ class SunpowerCryocooler(HardwareSensorBase):
 
     def get_cold_head_temp(self):
         """Get the temperature of the cold head."""
-        return parse_single_value(self._send_and_read("TC"))
+        return parse_float_value(self._send_and_read("TC"))
 
     def get_reject_temp(self):
         """Get the temperature of the reject heat."""
-        return parse_single_value(self._send_and_read("TEMP RJ"))
+        return parse_float_value(self._send_and_read("TEMP RJ"))
 
     def get_target_temp(self):
         """Get the target temperature set for the cryocooler."""
-        return parse_single_value(self._send_and_read("TTARGET"))
+        return parse_float_value(self._send_and_read("TTARGET"))
 
     def set_target_temp(self, temp_kelvin: float):
         """Set the target temperature for the cryocooler in Kelvin."""
@@ -212,16 +624,15 @@ class SunpowerCryocooler(HardwareSensorBase):
 
     def get_measured_power(self):
         """Get the measured power of the cryocooler."""
-        return parse_single_value(self._send_and_read("P"))
+        return parse_float_value(self._send_and_read("P"))
 
     def get_commanded_power(self):
         """Get the commanded power of the cryocooler."""
-        return parse_single_value(self._send_and_read("PWOUT"))
+        return parse_float_value(self._send_and_read("PWOUT"))
 
     def get_current_commanded_power(self):
         """Get the current commanded power of the cryocooler."""
-        retval = self._send_and_read("E")
-        return float(retval[3])
+        return parse_float_value(self._send_and_read("E"), idx=3)
 
     def set_commanded_power(self, watts: float):
         """Set the commanded power for the cryocooler in watts."""
@@ -234,3 +645,241 @@ class SunpowerCryocooler(HardwareSensorBase):
     def turn_off_cooler(self):
         """Turn off the cryocooler."""
         return parse_single_value(self._send_and_read("COOLER=OFF"))
+
+
+class SunpowerCryocoolerPool:
+    """Keep TCP connections to Sunpower controllers open for reuse.
+
+    Connections are keyed by (host, port) and reopened only once they have
+    been closed, e.g. after an error inside a ``with pool.get(...)`` block.
+    """
+    def __init__(self, **kwargs):
+        """Initialize the pool; kwargs are passed to each SunpowerCryocooler."""
+        self._kwargs = kwargs
+        self._conns = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close_all()
+
+    def get(self, host, port) -> SunpowerCryocooler:
+        """Return a connected controller for host:port, connecting if needed."""
+        conn = self._conns.get((host, port))
+        if conn is not None and conn.is_connected():
+            return conn
+        conn = SunpowerCryocooler(**self._kwargs)
+        conn.connect(host, port, con_type="tcp")
+        if not conn.is_connected():
+            raise IOError(f"Failed to establish connection: {host}:{port}")
+        conn._pooled = True  # pylint: disable=protected-access
+        self._conns[(host, port)] = conn
+        return conn
+
+    def close_all(self):
+        """Close every pooled connection."""
+        for conn in self._conns.values():
+            if conn.is_connected():
+                conn.disconnect()
+        self._conns.clear()
+
+
+class AsyncSunpowerCryocooler(HardwareSensorBase):
+    """An asyncio variant of SunpowerCryocooler for TCP connections.
+
+    Several controllers can be polled concurrently from one event loop, e.g.
+    ``await asyncio.gather(*(c.get_cold_head_temp() for c in coolers))``.
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, log: bool = True, logfile: str = __name__.rsplit(".", 1)[-1],
+                 read_timeout: float = 1.0, *, reply_gap: float = 0.02,
+                 connect_timeout: float = 0.5):
+        """ Initialize the AsyncSunpowerCryocooler."""
+
+        existing_handlers = list(logging.getLogger(logfile).handlers)
+        super().__init__(log, logfile)
+        _keep_existing_handlers(self.logger, existing_handlers)
+        self.read_timeout = read_timeout
+        self.reply_gap = reply_gap
+        self.connect_timeout = connect_timeout
+        self._reader = None
+        self._writer = None
+        self._lock = None
+        # Bytes received but not yet returned as complete lines
+        self._carry = bytearray()
+        self._atomic_dispatch = {
+            "cold_head_temp": self.get_cold_head_temp,
+            "reject_temp": self.get_reject_temp,
+            "target_temp": self.get_target_temp,
+            "measured_power": self.get_measured_power,
+            "commanded_power": self.get_commanded_power,
+            "current_commanded_power": self.get_current_commanded_power,
+        }
+
+    async def connect(self, host, port):  # pylint: disable=W0221,W0236
+        """Connect to the Sunpower controller."""
+        if not self.validate_connection_params((host, port)):
+            self.report_error(f"Invalid connection parameters: {host}:{port}")
+            self._set_connected(False)
+            return
+        try:
+            self._carry.clear()
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), timeout=self.connect_timeout)
+            sock = self._writer.get_extra_info("socket")
+            if sock is not None:
+                _tune_socket(sock)
+            # Created here so it binds to the running event loop
+            self._lock = asyncio.Lock()
+            self.report_info(f"TCP connection opened: {host}:{port}")
+            self._set_connected(True)
+        except Exception as ex:
+            self._set_connected(False)
+            self.report_error(f"Failed to establish connection: {ex}")
+            raise IOError(f"Failed to establish connection: {ex}") from ex
+
+    async def disconnect(self):  # pylint: disable=W0236
+        """Close the connection."""
+        if not self.is_connected():
+            self.report_warning("Already disconnected from device.")
+            return
+        try:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self.report_info("TCP connection closed.")
+            self._set_connected(False)
+        except Exception as ex:
+            raise IOError(f"Failed to close connection: {ex}") from ex
+
+    async def _send_command(self, command: str) -> bool:  # pylint: disable=W0221,W0236
+        """Send a command to the Sunpower controller."""
+        if not self.is_connected():
+            self.report_error("Device is not connected.")
+            return False
+
+        try:
+            payload = _encode_command(command)
+            # Any partial line still held belongs to an earlier reply
+            self._carry.clear()
+            if _debug_enabled(self.logger):
+                self.report_debug(f"Sending command: {payload!r}")
+            self._writer.write(payload)
+            await self._writer.drain()
+        except Exception as ex:
+            self.report_error(f"Failed to send command: {ex}")
+            raise IOError(f"Failed to send command: {ex}") from ex
+        self.report_debug("Command sent")
+        return True
+
+    async def _read_reply(self, expected_lines: int = 0) -> list:  # pylint: disable=W0236
+        """Read and return lines from the device.
+
+        Replies are framed as in SunpowerCryocooler._read_raw_tcp: only
+        complete lines are returned and an unterminated tail stays in _carry
+        for the next read.
+        """
+        if not self.is_connected():
+            self.report_error("Device is not connected.")
+            return []
+
+        carry = self._carry
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.read_timeout
+        timeout = self.read_timeout
+        try:
+            while timeout > 0:
+                try:
+                    chunk = await asyncio.wait_for(self._reader.read(4096), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if not chunk:
+                    break
+                carry += chunk
+                if expected_lines and _count_lines(carry) >= expected_lines:
+                    break
+                timeout = deadline - loop.time()
+                if not expected_lines and carry.endswith((b"\r", b"\n")):
+                    timeout = min(timeout, self.reply_gap)
+        except (socket.error, ValueError) as ex:
+            self.report_error(f"Failed to read reply: {ex}")
+            return []
+
+        raw_data = _take_complete(carry)
+        if not raw_data:
+            self.report_warning("TCP read timeout.", errno=-1)
+            return []
+        if _debug_enabled(self.logger):
+            self.report_debug(f"Raw received: {raw_data!r}")
+        return _decode_lines(raw_data)
+
+    async def _send_and_read(self, command: str):
+        """Send a command and read the reply."""
+        if not self.is_connected():
+            self.report_error(f"Failed to send command '{command}': Not connected")
+            return []
+        # Keep concurrent callers on one controller from interleaving replies
+        async with self._lock:
+            await self._send_command(command)
+            return _from_echo(await self._read_reply(_reply_lines(command)), command)
+
+    # --- User-Facing Methods (asynchronous) ---
+    async def get_atomic_value(self, item: str ="") -> Union[float, int, str, None]:  # pylint: disable=W0236
+        """Get the atomic value from the Sunpower cryocooler."""
+        getter = self._atomic_dispatch.get(item)
+        if getter is None:
+            self.report_error(f"Unknown item: {item}")
+            return None
+        return await getter()
+
+    async def get_status(self):
+        """Get the status of the Sunpower cryocooler."""
+        return await self._send_and_read("STATUS")
+
+    async def get_error(self):
+        """Get the last error message from the Sunpower cryocooler."""
+        return parse_single_value(await self._send_and_read("ERROR"))
+
+    async def get_version(self):
+        """Get the firmware version of the Sunpower cryocooler."""
+        return parse_single_value(await self._send_and_read("VERSION"))
+
+    async def get_cold_head_temp(self):
+        """Get the temperature of the cold head."""
+        return parse_float_value(await self._send_and_read("TC"))
+
+    async def get_reject_temp(self):
+        """Get the temperature of the reject heat."""
+        return parse_float_value(await self._send_and_read("TEMP RJ"))
+
+    async def get_target_temp(self):
+        """Get the target temperature set for the cryocooler."""
+        return parse_float_value(await self._send_and_read("TTARGET"))
+
+    async def set_target_temp(self, temp_kelvin: float):
+        """Set the target temperature for the cryocooler in Kelvin."""
+        return parse_single_value(await self._send_and_read(f"TTARGET={temp_kelvin}"))
+
+    async def get_measured_power(self):
+        """Get the measured power of the cryocooler."""
+        return parse_float_value(await self._send_and_read("P"))
+
+    async def get_commanded_power(self):
+        """Get the commanded power of the cryocooler."""
+        return parse_float_value(await self._send_and_read("PWOUT"))
+
+    async def get_current_commanded_power(self):
+        """Get the current commanded power of the cryocooler."""
+        return parse_float_value(await self._send_and_read("E"), idx=3)
+
+    async def set_commanded_power(self, watts: float):
+        """Set the commanded power for the cryocooler in watts."""
+        return parse_single_value(await self._send_and_read(f"PWOUT={watts}"))
+
+    async def turn_on_cooler(self):
+        """Turn on the cryocooler."""
+        return parse_single_value(await self._send_and_read("COOLER=ON"))
+
+    async def turn_off_cooler(self):
+        """Turn off the cryocooler."""
+        return parse_single_value(await self._send_and_read("COOLER=OFF"))
@@ -1,8 +1,22 @@
 """Test suite for the SunpowerCryocooler class in hispec.util module."""
+import asyncio
+import gc
+import logging
+import socket
+import struct
+import threading
+import time
 import unittest
-from unittest.mock import patch
+import weakref
+from unittest.mock import AsyncMock, MagicMock, patch
 # pylint: disable=import-error,no-name-in-module
-from sunpower import SunpowerCryocooler
+from sunpower import AsyncSunpowerCryocooler, SunpowerCryocooler, SunpowerCryocoolerPool
+from sunpower.sunpower_cryocooler import (
+    _tune_socket,
+    parse_float_value,
+    parse_indexed_value,
+    parse_single_value,
+)
 
 
 class TestSunpowerController(unittest.TestCase):
@@ -72,5 +86,492 @@ class TestSunpowerController(unittest.TestCase):
             mock_send_and_read.assert_called_once_with("P")
 
 
+class TestParseSingleValue(unittest.TestCase):
+    """Unit tests for reply value parsing."""
+
+    def test_parses_types(self):
+        """Test boolean, integer, float and string detection."""
+        self.assertIs(parse_single_value(["COOLER", "On"]), True)
+        self.assertIs(parse_single_value(["COOLER", "0"]), False)
+        self.assertEqual(parse_single_value(["P", "-72"]), -72)
+        self.assertEqual(parse_single_value(["TC", " 77.25 "]), 77.25)
+        self.assertEqual(parse_single_value(["TC", "1.5e2"]), 150.0)
+        self.assertEqual(parse_single_value(["VERSION", "v1.2"]), "v1.2")
+
+    def test_no_reply(self):
+        """Test that a reply without a value line is reported."""
+        self.assertEqual(parse_single_value(["TC"]), "No reply")
+
+    def test_indexed_value(self):
+        """Test parsing a value further down a multi-line reply."""
+        self.assertEqual(parse_indexed_value(["E", "1", "2", "3.5"], idx=3), 3.5)
+        self.assertEqual(parse_indexed_value(["E", "1"], idx=3), "No reply")
+        self.assertEqual(parse_indexed_value([], idx=3), "No reply")
+
+    def test_float_value(self):
+        """Test the numeric fast path and its fallback."""
+        self.assertIsInstance(parse_float_value(["P", "1"]), float)
+        self.assertEqual(parse_float_value(["TC", " 77.5"]), 77.5)
+        self.assertEqual(parse_float_value(["TC", "Fault"]), "Fault")
+        self.assertEqual(parse_float_value(["TC"]), "No reply")
+
+
+class TestSunpowerBatching(unittest.TestCase):
+    """Unit tests for batched queries."""
+
+    def setUp(self):
+        """Set up a controller that reports itself as connected."""
+        self.controller = SunpowerCryocooler()
+        patcher = patch.object(self.controller, "is_connected", return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_all_values_single_round_trip(self):
+        """Test that all queries are sent before a single reply read."""
+        lines = ["TC", "77.5", "E", "1", "2", "3.5", "P", "72"]
+        with patch.object(self.controller, "_send_commands") as mock_send, \
+                patch.object(self.controller, "_read_reply", return_value=lines) as mock_read:
+            result = self.controller.get_all_values(
+                ["cold_head_temp", "current_commanded_power", "measured_power"])
+            mock_send.assert_called_once_with(["TC", "E", "P"])
+            mock_read.assert_called_once_with(8)
+        self.assertEqual(result, {"cold_head_temp": 77.5,
+                                  "current_commanded_power": 3.5,
+                                  "measured_power": 72})
+
+    def test_get_all_values_missing_reply(self):
+        """Test that a truncated batch reply does not raise."""
+        with patch.object(self.controller, "_send_commands"), \
+                patch.object(self.controller, "_read_reply", return_value=["TC", "77.5"]):
+            result = self.controller.get_all_values(["cold_head_temp", "reject_temp"])
+        self.assertEqual(result, {"cold_head_temp": 77.5, "reject_temp": "No reply"})
+
+    def test_get_all_values_disconnected(self):
+        """Test that a disconnected batch uses the same sentinel as the getters."""
+        with patch.object(self.controller, "is_connected", return_value=False):
+            result = self.controller.get_all_values(["cold_head_temp"])
+        self.assertEqual(result, {"cold_head_temp": "No reply"})
+
+    def test_send_command_non_ascii_raises_ioerror(self):
+        """Test that an unencodable command is reported as an IOError."""
+        with self.assertRaises(IOError):
+            self.controller._send_command("TTARGET=\u00b0")  # pylint: disable=protected-access
+
+    def test_send_commands_single_gather_write(self):
+        """Test that batched commands go out in one gather write."""
+        ours, device = socket.socketpair()
+        self.addCleanup(ours.close)
+        self.addCleanup(device.close)
+        self.controller.con_type = "tcp"
+        self.controller.sock = MagicMock()
+        self.controller.sock.fileno.return_value = ours.fileno()
+        self.controller.sock.sendmsg.return_value = len(b"TC\rP\r")
+        self.controller._bind_io()  # pylint: disable=protected-access
+        self.controller._send_commands(["TC", "P"])  # pylint: disable=protected-access
+        self.controller.sock.sendmsg.assert_called_once_with([b"TC\r", b"P\r"])
+        self.controller.sock.sendall.assert_not_called()
+
+    def test_send_commands_serial_single_write(self):
+        """Test that batched serial commands go out in one joined write."""
+        self.controller.con_type = "serial"
+        self.controller.ser = MagicMock()
+        self.controller._bind_io()  # pylint: disable=protected-access
+        self.controller._send_commands(["TC", "P"])  # pylint: disable=protected-access
+        self.controller.ser.write.assert_called_once_with(b"TC\rP\r")
+
+
+class TestSunpowerReadPath(unittest.TestCase):
+    """Unit tests for reply framing over a socket pair and a mocked serial port."""
+
+    def _connect_tcp(self, **kwargs):
+        """Return a controller reading from one end of a socket pair, and the other end."""
+        controller = SunpowerCryocooler(**kwargs)
+        ours, device = socket.socketpair()
+        self.addCleanup(ours.close)
+        self.addCleanup(device.close)
+        controller.sock = ours
+        controller.con_type = "tcp"
+        controller._bind_io()  # pylint: disable=protected-access
+        controller._set_connected(True)  # pylint: disable=protected-access
+        return controller, device
+
+    @staticmethod
+    def _serve(device, values, delay=0.05):
+        """Answer each command with its echo at once and its value after delay."""
+        def serve():
+            for value in values:
+                command = device.recv(64).rstrip(b"\r")
+                device.sendall(command + b"\r\n")
+                time.sleep(delay)
+                device.sendall(b" " + value + b"\r\n")
+        threading.Thread(target=serve, daemon=True).start()
+
+    def test_returns_on_expected_lines(self):
+        """Test that the read returns as soon as the expected lines are in."""
+        controller, device = self._connect_tcp(read_timeout=5.0)
+        device.sendall(b"TC\r\n 77.5\r\n")
+        start = time.monotonic()
+        result = controller._read_reply(2)  # pylint: disable=protected-access
+        self.assertEqual(result, ["TC", "77.5"])
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_status_ends_after_reply_gap(self):
+        """Test that a reply of unknown length ends after the quiet gap."""
+        controller, device = self._connect_tcp(read_timeout=5.0, reply_gap=0.02)
+        device.sendall(b"STATUS\r\nA=1\r\nB=2\r\n")
+        start = time.monotonic()
+        result = controller._read_reply()  # pylint: disable=protected-access
+        self.assertEqual(result, ["STATUS", "A=1", "B=2"])
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_unterminated_tail_is_carried(self):
+        """Test that a partial line is held back and joined with the next read."""
+        controller, device = self._connect_tcp(read_timeout=0.1)
+        device.sendall(b"STATUS\r\nA=1\r\nB=")
+        self.assertEqual(controller._read_reply(), ["STATUS", "A=1"])  # pylint: disable=protected-access
+        self.assertEqual(bytes(controller._carry), b"B=")  # pylint: disable=protected-access
+        device.sendall(b"2\r\n")
+        self.assertEqual(controller._read_reply(), ["B=2"])  # pylint: disable=protected-access
+
+    def test_crlf_split_across_reads(self):
+        """Test that a CR/LF pair split across reads yields no extra lines."""
+        controller, device = self._connect_tcp(read_timeout=1.0)
+        device.sendall(b"TC\r")
+        device.sendall(b"\n 77.5\r")
+        self.assertEqual(controller._read_reply(2), ["TC", "77.5"])  # pylint: disable=protected-access
+        device.sendall(b"\nP\r\n 72\r\n")
+        self.assertEqual(controller._read_reply(2), ["P", "72"])  # pylint: disable=protected-access
+
+    def test_control_bytes_are_stripped(self):
+        """Test that stray control bytes are removed from reply lines."""
+        controller, device = self._connect_tcp(read_timeout=1.0)
+        device.sendall(b"\x00TC\r\n\x1b 77.5\r\n")
+        self.assertEqual(controller._read_reply(2), ["TC", "77.5"])  # pylint: disable=protected-access
+
+    def test_control_only_line_is_not_counted(self):
+        """Test that a line of nothing but control bytes doesn't complete a reply."""
+        controller, device = self._connect_tcp(read_timeout=1.0)
+        device.sendall(b"TC\r\n\x00\x1b\r\n")
+        threading.Timer(0.05, device.sendall, args=(b" 77.5\r\n",)).start()
+        self.assertEqual(controller._read_reply(2), ["TC", "77.5"])  # pylint: disable=protected-access
+
+    def test_set_command_waits_for_value(self):
+        """Test that a set command's reply is framed by line count, not the quiet gap."""
+        controller, device = self._connect_tcp(read_timeout=1.0, reply_gap=0.02)
+        self._serve(device, [b"ON", b"77.5"])
+        self.assertIs(controller.turn_on_cooler(), True)
+        self.assertEqual(controller.get_cold_head_temp(), 77.5)
+
+    def test_late_reply_is_discarded(self):
+        """Test that a reply arriving after its read gave up isn't taken by the next command."""
+        controller, device = self._connect_tcp(read_timeout=0.05)
+        self._serve(device, [b"77.5"], delay=0.1)
+        self.assertEqual(controller.get_cold_head_temp(), "No reply")
+        time.sleep(0.1)
+        self._serve(device, [b"30.0"], delay=0)
+        self.assertEqual(controller.get_reject_temp(), 30.0)
+
+    def test_timeout_returns_empty(self):
+        """Test that no reply within read_timeout gives an empty list."""
+        controller, _ = self._connect_tcp(read_timeout=0.05)
+        self.assertEqual(controller._read_reply(2), [])  # pylint: disable=protected-access
+
+    def test_serial_read(self):
+        """Test the serial path, including a reply split across reads."""
+        controller = SunpowerCryocooler()
+        controller.ser = MagicMock()
+        controller.ser.read.side_effect = [b"TC\r", b"\n 77.5\r\n", b""]
+        controller.con_type = "serial"
+        controller._bind_io()  # pylint: disable=protected-access
+        controller._set_connected(True)  # pylint: disable=protected-access
+        self.assertEqual(controller._read_reply(2), ["TC", "77.5"])  # pylint: disable=protected-access
+        self.assertEqual(controller._read_reply(2), [])  # pylint: disable=protected-access
+
+
+class TestSunpowerPollAll(unittest.TestCase):
+    """Unit tests for SunpowerCryocooler.poll_all against a local TCP listener."""
+
+    def setUp(self):
+        """Start a listener to stand in for the controllers."""
+        self.listener = socket.create_server(("127.0.0.1", 0))
+        self.addCleanup(self.listener.close)
+
+    def _connect(self):
+        """Return a connected controller and the device end of its socket."""
+        controller = SunpowerCryocooler(read_timeout=1.0)
+        controller.connect("127.0.0.1", self.listener.getsockname()[1])
+        self.addCleanup(lambda: controller.is_connected() and controller.disconnect())
+        device, _ = self.listener.accept()
+        self.addCleanup(device.close)
+        return controller, device
+
+    @staticmethod
+    def _answer(device, reply=b"TC\r\n 77.5\r\n"):
+        """Send reply from the device end once the command has arrived."""
+        def answer():
+            device.recv(64)
+            device.sendall(reply)
+        threading.Thread(target=answer, daemon=True).start()
+
+    @staticmethod
+    def _reset(device):
+        """Close the device end with an RST instead of a FIN."""
+        device.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        device.close()
+
+    def test_all_devices_reply(self):
+        """Test that every controller's reply is collected."""
+        pairs = [self._connect() for _ in range(3)]
+        for _, device in pairs:
+            self._answer(device)
+        replies = SunpowerCryocooler.poll_all("TC", timeout=2.0)
+        for controller, _ in pairs:
+            self.assertEqual(replies[controller], ["TC", "77.5"])
+
+    def test_device_times_out(self):
+        """Test that a silent controller maps to [] and stays connected."""
+        (healthy, healthy_dev), (silent, _) = self._connect(), self._connect()
+        self._answer(healthy_dev)
+        replies = SunpowerCryocooler.poll_all("TC", timeout=0.2)
+        self.assertEqual(replies[healthy], ["TC", "77.5"])
+        self.assertEqual(replies[silent], [])
+        self.assertTrue(silent.is_connected())
+
+    def test_device_resets(self):
+        """Test that a reset connection doesn't lose the other replies."""
+        (healthy, healthy_dev), (broken, broken_dev) = self._connect(), self._connect()
+        threading.Timer(0.1, healthy_dev.sendall, args=(b"TC\r\n 77.5\r\n",)).start()
+        # Let poll_all's command reach the device first so it is unread at reset
+        threading.Timer(0.05, self._reset, args=(broken_dev,)).start()
+        replies = SunpowerCryocooler.poll_all("TC", timeout=2.0)
+        self.assertEqual(replies[healthy], ["TC", "77.5"])
+        self.assertEqual(replies[broken], [])
+        self.assertFalse(broken.is_connected())
+
+    def test_device_closes(self):
+        """Test that a closed peer is disconnected and doesn't hold up the poll."""
+        (healthy, healthy_dev), (closed, closed_dev) = self._connect(), self._connect()
+        self._answer(healthy_dev)
+        closed_dev.close()
+        start = time.monotonic()
+        replies = SunpowerCryocooler.poll_all("TC", timeout=5.0)
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(replies[healthy], ["TC", "77.5"])
+        self.assertEqual(replies[closed], [])
+        self.assertFalse(closed.is_connected())
+
+    def test_reconnect_replaces_socket(self):
+        """Test that connecting again closes the old socket and polls only the new one."""
+        controller, _ = self._connect()
+        old_sock = controller.sock
+        controller.connect("127.0.0.1", self.listener.getsockname()[1])
+        device, _ = self.listener.accept()
+        self.addCleanup(device.close)
+        self.assertEqual(old_sock.fileno(), -1)
+        self._answer(device)
+        replies = SunpowerCryocooler.poll_all("TC", timeout=2.0)
+        self.assertEqual(replies, {controller: ["TC", "77.5"]})
+
+    def test_dropped_instance_is_collected(self):
+        """Test that the poll registry doesn't keep a connected instance alive."""
+        controller = SunpowerCryocooler()
+        controller.connect("127.0.0.1", self.listener.getsockname()[1])
+        device, _ = self.listener.accept()
+        self.addCleanup(device.close)
+        ref = weakref.ref(controller)
+        sock = controller.sock
+        self.addCleanup(sock.close)
+        del controller
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+class TestSunpowerSocketTuning(unittest.TestCase):
+    """Unit tests for the socket options set on TCP connections."""
+
+    def test_connect_tunes_socket(self):
+        """Test that connect applies the timeout, the defaults and socket_options."""
+        listener = socket.create_server(("127.0.0.1", 0))
+        self.addCleanup(listener.close)
+        address = listener.getsockname()
+        controller = SunpowerCryocooler(
+            connect_timeout=0.25,
+            socket_options=[(socket.SOL_SOCKET, socket.SO_RCVBUF, 32768)])
+        with patch("socket.create_connection",
+                   wraps=socket.create_connection) as mock_create:
+            controller.connect(*address)
+        self.addCleanup(controller.disconnect)
+        mock_create.assert_called_once_with(address, timeout=0.25)
+        sock = controller.sock
+        self.assertTrue(sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+        self.assertTrue(sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE))
+        self.assertGreaterEqual(sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF), 32768)
+
+    def test_unsupported_keepalive_tuning_is_ignored(self):
+        """Test that a platform rejecting the keepalive timers doesn't fail the connect."""
+        sock = MagicMock()
+        sock.setsockopt.side_effect = [None, None, OSError("not supported")]
+        _tune_socket(sock)
+        self.assertEqual(sock.setsockopt.call_count, 3)
+
+
+class TestSunpowerPool(unittest.TestCase):
+    """Unit tests for the SunpowerCryocoolerPool class."""
+
+    def setUp(self):
+        """Patch out the TCP connection so connect() just marks us connected."""
+        def fake_connect(controller, *_args, **_kwargs):
+            controller._set_connected(True)  # pylint: disable=protected-access
+
+        def fake_disconnect(controller):
+            controller._set_connected(False)  # pylint: disable=protected-access
+
+        for name, fake in (("connect", fake_connect), ("disconnect", fake_disconnect)):
+            patcher = patch.object(SunpowerCryocooler, name, autospec=True, side_effect=fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_reuses_connection(self):
+        """Test that a pooled connection stays open across with blocks."""
+        pool = SunpowerCryocoolerPool()
+        with pool.get("10.0.0.1", 10016) as first:
+            pass
+        with pool.get("10.0.0.1", 10016) as second:
+            pass
+        self.assertIs(first, second)
+        self.assertTrue(second.is_connected())
+        SunpowerCryocooler.connect.assert_called_once()
+
+    def test_reconnects_after_error(self):
+        """Test that an error closes the connection and the next get reopens it."""
+        pool = SunpowerCryocoolerPool()
+        with self.assertRaises(IOError):
+            with pool.get("10.0.0.1", 10016) as first:
+                raise IOError("boom")
+        self.assertFalse(first.is_connected())
+        self.assertIsNot(pool.get("10.0.0.1", 10016), first)
+
+    def test_unpooled_with_block_disconnects(self):
+        """Test that a plain controller closes at the end of a with block."""
+        controller = SunpowerCryocooler()
+        controller.connect("10.0.0.1", 10016)
+        with controller:
+            pass
+        self.assertFalse(controller.is_connected())
+
+
+class TestSunpowerLogging(unittest.TestCase):
+    """Unit tests for logger setup."""
+
+    def test_shared_logfile_does_not_duplicate_handlers(self):
+        """Test that instances sharing a logfile share one set of handlers."""
+        first = SunpowerCryocooler(logfile="sunpower_shared_test")
+        handlers = list(first.logger.handlers)
+        second = SunpowerCryocooler(logfile="sunpower_shared_test")
+        self.assertEqual(second.logger.handlers, handlers)
+
+    def test_application_handlers_are_kept(self):
+        """Test that handlers attached by the application are not removed."""
+        base_count = len(SunpowerCryocooler(logfile="sunpower_control_test").logger.handlers)
+        foreign = logging.NullHandler()
+        logging.getLogger("sunpower_foreign_test").addHandler(foreign)
+        first = SunpowerCryocooler(logfile="sunpower_foreign_test")
+        self.assertIn(foreign, first.logger.handlers)
+        self.assertEqual(len(first.logger.handlers), base_count + 1)
+        handlers = list(first.logger.handlers)
+        second = SunpowerCryocooler(logfile="sunpower_foreign_test")
+        self.assertEqual(second.logger.handlers, handlers)
+
+    def test_handlers_restored_after_reconfiguration(self):
+        """Test that a logger cleared by the application gets handlers again."""
+        base_count = len(SunpowerCryocooler(logfile="sunpower_reconfig_test").logger.handlers)
+        logger = logging.getLogger("sunpower_reconfig_test")
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+        controller = SunpowerCryocooler(logfile="sunpower_reconfig_test")
+        self.assertEqual(len(controller.logger.handlers), base_count)
+
+
+class TestAsyncSunpower(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the AsyncSunpowerCryocooler class."""
+
+    async def test_get_cold_head_temp(self):
+        """Test getting the cold head temperature asynchronously."""
+        controller = AsyncSunpowerCryocooler()
+        with patch.object(controller, "_send_and_read",
+                          new=AsyncMock(return_value=["TC", "77.5"])) as mock_send_and_read:
+            result = await controller.get_atomic_value("cold_head_temp")
+            mock_send_and_read.assert_awaited_once_with("TC")
+        self.assertEqual(result, 77.5)
+
+    def _connected(self, **kwargs):
+        """Return a controller reading from a fed StreamReader."""
+        controller = AsyncSunpowerCryocooler(**kwargs)
+        controller._reader = asyncio.StreamReader()  # pylint: disable=protected-access
+        controller._set_connected(True)  # pylint: disable=protected-access
+        return controller
+
+    async def test_read_reply_returns_on_expected_lines(self):
+        """Test that the read returns once the expected lines are in."""
+        controller = self._connected(read_timeout=5.0)
+        controller._reader.feed_data(b"TC\r\n 77.5\r\n")  # pylint: disable=protected-access
+        start = time.monotonic()
+        result = await controller._read_reply(2)  # pylint: disable=protected-access
+        self.assertEqual(result, ["TC", "77.5"])
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    async def test_read_reply_returns_after_reply_gap(self):
+        """Test that a reply of unknown length ends after the quiet gap."""
+        controller = self._connected(read_timeout=5.0, reply_gap=0.02)
+        controller._reader.feed_data(b"STATUS\r\nA=1\r\nB=2\r\n")  # pylint: disable=protected-access
+        start = time.monotonic()
+        result = await controller._read_reply()  # pylint: disable=protected-access
+        self.assertEqual(result, ["STATUS", "A=1", "B=2"])
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    async def test_read_reply_timeout(self):
+        """Test that no reply within read_timeout gives an empty list."""
+        controller = self._connected(read_timeout=0.05)
+        self.assertEqual(await controller._read_reply(2), [])  # pylint: disable=protected-access
+
+    async def test_unterminated_tail_is_carried(self):
+        """Test that a partial line is held back and joined with the next read."""
+        controller = self._connected(read_timeout=0.1)
+        controller._reader.feed_data(b"STATUS\r\nA=1\r\nB=")  # pylint: disable=protected-access
+        self.assertEqual(await controller._read_reply(), ["STATUS", "A=1"])  # pylint: disable=protected-access
+        self.assertEqual(bytes(controller._carry), b"B=")  # pylint: disable=protected-access
+        controller._reader.feed_data(b"2\r\n")  # pylint: disable=protected-access
+        self.assertEqual(await controller._read_reply(), ["B=2"])  # pylint: disable=protected-access
+
+    async def test_concurrent_calls_do_not_interleave(self):
+        """Test that the per-instance lock keeps each reply with its command."""
+        controller = self._connected(read_timeout=0.5)
+        controller._lock = asyncio.Lock()  # pylint: disable=protected-access
+
+        def reply(payload):
+            controller._reader.feed_data(  # pylint: disable=protected-access
+                payload.replace(b"\r", b"\r\n") + b" 1.5\r\n")
+
+        controller._writer = MagicMock()  # pylint: disable=protected-access
+        controller._writer.write.side_effect = reply  # pylint: disable=protected-access
+        controller._writer.drain = AsyncMock()  # pylint: disable=protected-access
+        results = await asyncio.gather(controller.get_cold_head_temp(),
+                                       controller.get_reject_temp())
+        self.assertEqual(results, [1.5, 1.5])
+
+    async def test_reply_resyncs_on_echo(self):
+        """Test that lines left over from a late reply are skipped up to the echo."""
+        controller = self._connected(read_timeout=0.5)
+        controller._lock = asyncio.Lock()  # pylint: disable=protected-access
+        controller._reader.feed_data(b" 77.5\r\n")  # pylint: disable=protected-access
+        controller._writer = MagicMock()  # pylint: disable=protected-access
+        controller._writer.write.side_effect = (  # pylint: disable=protected-access
+            lambda payload: controller._reader.feed_data(  # pylint: disable=protected-access
+                b"TEMP RJ\r\n 30.0\r\n"))
+        controller._writer.drain = AsyncMock()  # pylint: disable=protected-access
+        self.assertEqual(await controller.get_reject_temp(), 30.0)
+
+
 if __name__ == "__main__":
     unittest.main()